@@ -9,23 +9,42 @@ __version__ = "0.1.0"
 __author__ = "Data Science Student"
 
 # Import commonly used utilities
-from .data_utils import *
-from .viz_utils import *
-from .ml_utils import *
+from .data_utils import load_data, save_data, validate_data, get_data_info
+from .viz_utils import (
+    create_plot,
+    save_plot,
+    set_plot_style,
+    create_correlation_heatmap,
+    create_distribution_plot,
+    add_statistical_annotations,
+)
+from .ml_utils import (
+    evaluate_model,
+    cross_validate,
+    feature_importance,
+    prepare_data_for_ml,
+    create_model_summary,
+)
 
 __all__ = [
     # Data utilities
     "load_data",
     "save_data",
     "validate_data",
+    "get_data_info",
     
     # Visualization utilities
     "create_plot",
     "save_plot",
     "set_plot_style",
+    "create_correlation_heatmap",
+    "create_distribution_plot",
+    "add_statistical_annotations",
     
     # Machine Learning utilities
     "evaluate_model",
     "cross_validate",
     "feature_importance",
+    "prepare_data_for_ml",
+    "create_model_summary",
 ]
@@ -5,32 +5,55 @@ This module provides functions for loading, saving, and validating data
 across different projects.
 """
 
+import os
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Union, Optional, Dict, Any
+from typing import Union, Optional, Dict, Any, Iterable, Iterator, List, Tuple
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging; handlers and levels are left to the host application
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# In-process LRU cache of loaded frames, keyed by file identity and read options;
+# entries are (frame, bytes) and the total is bounded by _LOAD_CACHE_MAX_BYTES
+_LOAD_CACHE: "OrderedDict[tuple, Tuple[pd.DataFrame, int]]" = OrderedDict()
+_LOAD_CACHE_SIZE = 8
+_LOAD_CACHE_MAX_BYTES = 256 * 1024 ** 2
 
 
 def load_data(
     file_path: Union[str, Path],
     file_type: Optional[str] = None,
+    fast: bool = False,
+    chunksize: Optional[int] = None,
+    cache: bool = True,
     **kwargs
-) -> pd.DataFrame:
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Load data from various file formats.
     
     Args:
         file_path: Path to the data file
         file_type: Type of file (auto-detected if None)
+        fast: Read CSV/Parquet with the pyarrow engine into Arrow-backed
+            columns (also enabled by the YPP_FAST_IO=1 environment variable).
+            String-heavy frames benefit the most; requires pyarrow.
+        chunksize: If set, return an iterator of DataFrames with at most
+            this many rows each instead of loading the whole file
+            (CSV, Parquet and HDF5 only)
+        cache: Reuse a previously loaded frame if the file (path, mtime,
+            size) and read options are unchanged. Returns a deep copy, so
+            edits to the result never reach the cached frame. The cache keeps
+            its own copy of each frame alive, up to 8 frames and 256 MB in
+            total; larger frames are not cached.
         **kwargs: Additional arguments passed to pandas read functions
         
     Returns:
-        Loaded data as pandas DataFrame
+        Loaded data as pandas DataFrame, or an iterator of DataFrames
+        when chunksize is given
         
     Raises:
         FileNotFoundError: If file doesn't exist
@@ -45,25 +68,98 @@ def load_data(
     if file_type is None:
         file_type = file_path.suffix.lower()
     
+    fast = fast or os.environ.get('YPP_FAST_IO') == '1'
+    if fast and file_type in ['.csv', '.txt', '.parquet']:
+        kwargs.setdefault('dtype_backend', 'pyarrow')
+        # The pyarrow CSV engine cannot stream, so chunked reads keep the C parser
+        if chunksize is None:
+            kwargs.setdefault('engine', 'pyarrow')
+    
+    # Serve repeated loads of an unchanged file from the cache
+    cache_key = None
+    if cache and chunksize is None:
+        stat = file_path.stat()
+        cache_key = (
+            str(file_path.resolve()), stat.st_mtime_ns, stat.st_size,
+            file_type, tuple(sorted(kwargs.items()))
+        )
+        try:
+            cached = _LOAD_CACHE.get(cache_key)
+        except TypeError:
+            # Unhashable read options (e.g. a dtype dict) bypass the cache
+            cache_key = cached = None
+        if cached is not None:
+            _LOAD_CACHE.move_to_end(cache_key)
+            return cached[0].copy()
+    
     try:
+        if chunksize is not None:
+            if file_type in ['.csv', '.txt']:
+                return pd.read_csv(file_path, chunksize=chunksize, **kwargs)
+            elif file_type in ['.parquet']:
+                return _iter_parquet(file_path, chunksize, **kwargs)
+            elif file_type in ['.h5', '.hdf5']:
+                return pd.read_hdf(file_path, chunksize=chunksize, iterator=True, **kwargs)
+            else:
+                raise ValueError(f"Chunked reading is not supported for file type: {file_type}")
+        
         if file_type in ['.csv', '.txt']:
-            return pd.read_csv(file_path, **kwargs)
+            data = pd.read_csv(file_path, **kwargs)
         elif file_type in ['.xlsx', '.xls']:
-            return pd.read_excel(file_path, **kwargs)
+            data = pd.read_excel(file_path, **kwargs)
         elif file_type in ['.parquet']:
-            return pd.read_parquet(file_path, **kwargs)
+            data = pd.read_parquet(file_path, **kwargs)
         elif file_type in ['.h5', '.hdf5']:
-            return pd.read_hdf(file_path, **kwargs)
+            data = pd.read_hdf(file_path, **kwargs)
         elif file_type in ['.json']:
-            return pd.read_json(file_path, **kwargs)
+            data = pd.read_json(file_path, **kwargs)
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
+        
+        if cache_key is not None:
+            nbytes = int(data.memory_usage(deep=True).sum())
+            if nbytes <= _LOAD_CACHE_MAX_BYTES:
+                _LOAD_CACHE[cache_key] = (data, nbytes)
+                # Evict least recently used frames over the count or byte budget
+                while (len(_LOAD_CACHE) > _LOAD_CACHE_SIZE
+                       or sum(size for _, size in _LOAD_CACHE.values()) > _LOAD_CACHE_MAX_BYTES):
+                    _LOAD_CACHE.popitem(last=False)
+                return data.copy()
+        return data
             
     except Exception as e:
         logger.error(f"Error loading file {file_path}: {e}")
         raise
 
 
+def _iter_parquet(
+    file_path: Path,
+    batch_size: int,
+    columns: Optional[list] = None,
+    dtype_backend: Optional[str] = None,
+    **kwargs
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a Parquet file batch by batch with pyarrow.
+    
+    Args:
+        file_path: Path to the Parquet file
+        batch_size: Maximum number of rows per batch
+        columns: Subset of columns to read
+        dtype_backend: Use Arrow-backed columns if set to "pyarrow"
+        **kwargs: Additional arguments passed to ParquetFile.iter_batches
+        
+    Yields:
+        One DataFrame per record batch
+    """
+    import pyarrow.parquet as pq
+    
+    types_mapper = pd.ArrowDtype if dtype_backend == 'pyarrow' else None
+    parquet_file = pq.ParquetFile(file_path)
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns, **kwargs):
+        yield batch.to_pandas(types_mapper=types_mapper)
+
+
 def save_data(
     data: pd.DataFrame,
     file_path: Union[str, Path],
@@ -110,21 +206,37 @@ def save_data(
 
 
 def validate_data(
-    data: pd.DataFrame,
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
     expected_columns: Optional[list] = None,
     expected_dtypes: Optional[Dict[str, Any]] = None,
     check_missing: bool = True,
-    check_duplicates: bool = True
+    check_duplicates: bool = True,
+    max_tracked_rows: int = 10_000_000,
+    deep_memory: bool = False,
+    approximate: bool = False
 ) -> Dict[str, Any]:
     """
     Validate data quality and structure.
     
     Args:
-        data: DataFrame to validate
+        data: DataFrame to validate, or an iterable of DataFrame chunks
+            (e.g. from load_data(..., chunksize=n)) that is validated
+            incrementally without loading the whole dataset
         expected_columns: List of expected column names
         expected_dtypes: Dictionary of expected column data types
         check_missing: Whether to check for missing values
         check_duplicates: Whether to check for duplicate rows
+        max_tracked_rows: For chunked input, the maximum number of row hashes
+            kept to detect duplicates across chunks; beyond it the duplicate
+            count is a lower bound
+        deep_memory: Measure the real size of object (e.g. string) columns for
+            the memory_usage summary. Off by default because it inspects every
+            Python object; shallow usage counts only pointer sizes for them.
+        approximate: Count duplicate rows by 64-bit row hashes instead of an
+            exact row comparison. Much faster on wide frames; float columns are
+            normalized so -0.0/0.0 and NaN variants match as in duplicated(),
+            and the only remaining inaccuracy is a hash collision, which could
+            in principle over-count. Chunked input always uses hashes.
         
     Returns:
         Dictionary with validation results
@@ -136,31 +248,51 @@ def validate_data(
         'summary': {}
     }
     
+    # Compute column-wise reductions once and reuse them below
+    if not isinstance(data, pd.DataFrame):
+        stats = _scan_chunks(
+            data, check_missing, check_duplicates, max_tracked_rows, deep_memory
+        )
+    elif data.empty:
+        stats = {'shape': data.shape}
+    else:
+        stats = {
+            'shape': data.shape,
+            'dtypes': data.dtypes,
+            'memory_usage': data.memory_usage(deep=deep_memory).sum(),
+            'missing_counts': data.isnull().sum() if check_missing else None,
+            'duplicate_count': _count_duplicates(data, approximate) if check_duplicates else 0
+        }
+    
     # Check if DataFrame is empty
-    if data.empty:
+    if 0 in stats['shape']:
         validation_results['is_valid'] = False
         validation_results['errors'].append("DataFrame is empty")
         return validation_results
     
+    dtypes = stats['dtypes']
+    missing_counts = stats['missing_counts']
+    duplicate_count = stats['duplicate_count']
+    
     # Check expected columns
     if expected_columns:
-        missing_cols = set(expected_columns) - set(data.columns)
+        missing_cols = set(expected_columns) - set(dtypes.index)
         if missing_cols:
             validation_results['is_valid'] = False
             validation_results['errors'].append(f"Missing columns: {missing_cols}")
     
-    # Check data types
+    # Check data types with one vectorized comparison of dtype names
     if expected_dtypes:
-        for col, expected_dtype in expected_dtypes.items():
-            if col in data.columns:
-                if not pd.api.types.is_dtype_equal(data[col].dtype, expected_dtype):
-                    validation_results['warnings'].append(
-                        f"Column {col} has dtype {data[col].dtype}, expected {expected_dtype}"
-                    )
+        cols = [col for col in expected_dtypes if col in dtypes]
+        actual = dtypes[cols].astype(str).to_numpy()
+        expected = np.array([_dtype_name(expected_dtypes[col]) for col in cols])
+        for col in np.asarray(cols, dtype=object)[actual != expected]:
+            validation_results['warnings'].append(
+                f"Column {col} has dtype {dtypes[col]}, expected {expected_dtypes[col]}"
+            )
     
     # Check missing values
     if check_missing:
-        missing_counts = data.isnull().sum()
         if missing_counts.sum() > 0:
             validation_results['warnings'].append(
                 f"Missing values found: {missing_counts.to_dict()}"
@@ -168,7 +300,6 @@ def validate_data(
     
     # Check duplicates
     if check_duplicates:
-        duplicate_count = data.duplicated().sum()
         if duplicate_count > 0:
             validation_results['warnings'].append(
                 f"Found {duplicate_count} duplicate rows"
@@ -176,16 +307,167 @@ def validate_data(
     
     # Generate summary
     validation_results['summary'] = {
-        'shape': data.shape,
-        'memory_usage': data.memory_usage(deep=True).sum(),
-        'dtypes': data.dtypes.to_dict(),
-        'missing_values': data.isnull().sum().to_dict() if check_missing else {},
-        'duplicate_rows': data.duplicated().sum() if check_duplicates else 0
+        'shape': stats['shape'],
+        'memory_usage': stats['memory_usage'],
+        'dtypes': dtypes.to_dict(),
+        'missing_values': missing_counts.to_dict() if check_missing else {},
+        'duplicate_rows': duplicate_count
     }
     
     return validation_results
 
 
+def _dtype_name(dtype: Any) -> str:
+    """Normalize a dtype spec (string, numpy/pandas dtype or type) to its name."""
+    try:
+        return str(pd.api.types.pandas_dtype(dtype))
+    except TypeError:
+        return str(dtype)
+
+
+def _count_duplicates(data: pd.DataFrame, approximate: bool = False) -> int:
+    """
+    Count duplicate rows, optionally by row hash only.
+    
+    Args:
+        data: DataFrame to check
+        approximate: Compare vectorized 64-bit row hashes instead of values
+        
+    Returns:
+        Number of rows that repeat an earlier row
+    """
+    if not approximate:
+        return int(data.duplicated().sum())
+    hashes = _row_hashes(data)
+    return len(hashes) - len(np.unique(hashes))
+
+
+def _row_hashes(data: pd.DataFrame) -> np.ndarray:
+    """
+    Hash each row of data to 64 bits, consistently with DataFrame.duplicated.
+    
+    hash_pandas_object hashes the raw bits of each column's own dtype, so
+    1 (int64) and 1.0 (float64) hash differently, as do -0.0 and 0.0 and NaNs
+    with different sign or payload bits, although duplicated() and value
+    comparison treat them as equal. Numeric columns (bool, int, float, and
+    their nullable variants) are therefore hashed as float64 with -0.0 and
+    NaN/NA canonicalized. This also keeps hashes stable across chunks whose
+    inferred dtype changes, as read_csv does when a later chunk of an int
+    column contains NaN. Integers beyond 2**53 can then share a hash, which
+    like a hash collision can only over-count.
+    
+    Args:
+        data: DataFrame to hash
+        
+    Returns:
+        uint64 array with one hash per row
+    """
+    numeric_positions = [
+        i for i, dtype in enumerate(data.dtypes)
+        if pd.api.types.is_bool_dtype(dtype)
+        or pd.api.types.is_integer_dtype(dtype)
+        or pd.api.types.is_float_dtype(dtype)
+    ]
+    if numeric_positions:
+        data = data.copy(deep=False)
+        for i in numeric_positions:
+            values = data.iloc[:, i].to_numpy(dtype=np.float64, na_value=np.nan) + 0.0
+            values[np.isnan(values)] = np.nan
+            data.isetitem(i, values)
+    return pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+
+def _scan_chunks(
+    chunks: Iterable[pd.DataFrame],
+    check_missing: bool,
+    check_duplicates: bool,
+    max_tracked_rows: int,
+    deep_memory: bool = False
+) -> Dict[str, Any]:
+    """
+    Accumulate validation statistics over DataFrame chunks.
+    
+    Only one chunk is held in memory at a time. Duplicates are detected by
+    64-bit row hashes: exactly within a chunk, and across chunks against a
+    sorted array of at most max_tracked_rows previously seen hashes.
+    
+    Args:
+        chunks: Iterable of DataFrames sharing the same columns
+        check_missing: Whether to count missing values
+        check_duplicates: Whether to count duplicate rows
+        max_tracked_rows: Maximum number of row hashes remembered
+        deep_memory: Whether to measure object columns deeply
+        
+    Returns:
+        Dictionary with shape, dtypes, memory_usage, missing_counts and
+        duplicate_count
+    """
+    n_rows = 0
+    dtypes = None
+    memory_usage = 0
+    missing_counts = None
+    duplicate_count = 0
+    seen_hashes = np.empty(0, dtype=np.uint64)
+    
+    for chunk in chunks:
+        if dtypes is None:
+            dtypes = chunk.dtypes
+        n_rows += len(chunk)
+        memory_usage += chunk.memory_usage(deep=deep_memory).sum()
+        
+        if check_missing:
+            chunk_missing = chunk.isnull().sum()
+            missing_counts = chunk_missing if missing_counts is None else missing_counts + chunk_missing
+        
+        if check_duplicates:
+            hashes = np.unique(_row_hashes(chunk))
+            duplicate_count += len(chunk) - len(hashes)
+            if seen_hashes.size:
+                pos = np.minimum(np.searchsorted(seen_hashes, hashes), seen_hashes.size - 1)
+                seen = seen_hashes[pos] == hashes
+                duplicate_count += int(seen.sum())
+                hashes = hashes[~seen]
+            room = max_tracked_rows - seen_hashes.size
+            if room > 0:
+                seen_hashes = np.union1d(seen_hashes, hashes[:room])
+    
+    if dtypes is None:
+        dtypes = pd.Series(dtype=object)
+    return {
+        'shape': (n_rows, len(dtypes)),
+        'dtypes': dtypes,
+        'memory_usage': memory_usage,
+        'missing_counts': missing_counts if missing_counts is not None else pd.Series(0, index=dtypes.index),
+        'duplicate_count': duplicate_count
+    }
+
+
+def _split_by_kind(dtypes: pd.Series) -> Tuple[List[Any], List[Any], List[Any]]:
+    """
+    Bin columns into numeric, categorical and datetime in a single pass.
+    
+    Matches select_dtypes with np.number, ['object', 'category'] and
+    'datetime' respectively; other dtypes (bool, string, tz-aware
+    datetimes) are skipped.
+    
+    Args:
+        dtypes: Column dtypes, e.g. DataFrame.dtypes
+        
+    Returns:
+        Tuple of (numeric_columns, categorical_columns, datetime_columns)
+    """
+    numeric, categorical, datetime = [], [], []
+    for col, dtype in dtypes.items():
+        if dtype.kind in 'iufcm':
+            numeric.append(col)
+        elif dtype.kind == 'M':
+            if not isinstance(dtype, pd.DatetimeTZDtype):
+                datetime.append(col)
+        elif dtype == object or isinstance(dtype, pd.CategoricalDtype):
+            categorical.append(col)
+    return numeric, categorical, datetime
+
+
 def get_data_info(data: pd.DataFrame) -> Dict[str, Any]:
     """
     Get comprehensive information about a DataFrame.
@@ -196,17 +478,23 @@ def get_data_info(data: pd.DataFrame) -> Dict[str, Any]:
     Returns:
         Dictionary with data information
     """
+    # Column-wise reductions run once over the whole frame
+    missing_counts = data.isnull().sum()
+    duplicate_count = data.duplicated().sum()
+    dtypes = data.dtypes
+    numeric_columns, categorical_columns, datetime_columns = _split_by_kind(dtypes)
+    
     info = {
         'shape': data.shape,
         'columns': list(data.columns),
-        'dtypes': data.dtypes.to_dict(),
+        'dtypes': dtypes.to_dict(),
         'memory_usage': data.memory_usage(deep=True).sum(),
-        'missing_values': data.isnull().sum().to_dict(),
-        'numeric_columns': list(data.select_dtypes(include=[np.number]).columns),
-        'categorical_columns': list(data.select_dtypes(include=['object', 'category']).columns),
-        'datetime_columns': list(data.select_dtypes(include=['datetime']).columns),
-        'duplicate_rows': data.duplicated().sum(),
-        'unique_counts': {col: data[col].nunique() for col in data.columns}
+        'missing_values': missing_counts.to_dict(),
+        'numeric_columns': numeric_columns,
+        'categorical_columns': categorical_columns,
+        'datetime_columns': datetime_columns,
+        'duplicate_rows': duplicate_count,
+        'unique_counts': data.nunique().to_dict()
     }
     
     return info
@@ -5,21 +5,82 @@ This module provides functions for model evaluation, cross-validation,
 feature importance analysis, and other ML-related tasks.
 """
 
+from collections import OrderedDict
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from typing import Union, List, Dict, Any, Tuple, Optional
-from sklearn.model_selection import cross_val_score, train_test_split, StratifiedKFold
-from sklearn.metrics import (
-    accuracy_score, precision_score, recall_score, f1_score,
-    roc_auc_score, mean_squared_error, mean_absolute_error, r2_score,
-    classification_report, confusion_matrix
-)
-from sklearn.preprocessing import StandardScaler, LabelEncoder
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+from .data_utils import _split_by_kind
+
+# Set up logging; handlers and levels are left to the host application
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# LRU cache of feature importance tables, keyed by model identity
+_FI_CACHE: "OrderedDict[tuple, Tuple[Any, List[Any], pd.DataFrame]]" = OrderedDict()
+_FI_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=None)
+def _binary_confusion_kernel():
+    """
+    Compile the fused binary confusion-count kernel on first use.
+    
+    Returns:
+        Numba-jitted function (y_true, y_pred) -> (tp, fp, fn, tn) over
+        int8 0/1 arrays, or None if numba is not installed
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    
+    @njit(cache=True, parallel=True)
+    def kernel(y_true, y_pred):
+        tp = fp = fn = tn = 0
+        for i in prange(y_true.size):
+            a = y_true[i]
+            b = y_pred[i]
+            tp += a & b
+            fp += (1 - a) & b
+            fn += a & (1 - b)
+            tn += (1 - a) & (1 - b)
+        return tp, fp, fn, tn
+    
+    return kernel
+
+
+def _binary_confusion(
+    y_true: Union[pd.Series, np.ndarray],
+    y_pred: Union[pd.Series, np.ndarray],
+    classes: np.ndarray
+) -> Tuple[int, int, int, int]:
+    """
+    Count (tn, fp, fn, tp) for a binary problem, treating classes[1] as positive.
+    
+    Uses a single fused numba pass when numba is available and falls back
+    to sklearn's confusion_matrix otherwise. Labels outside classes are
+    rejected up front, so both paths see the same input.
+    
+    Raises:
+        ValueError: If y_true or y_pred contains a label not in classes
+    """
+    if not (np.isin(y_true, classes).all() and np.isin(y_pred, classes).all()):
+        raise ValueError("Predictions contain labels not present in y_test; "
+                         "target is multiclass but average='binary'")
+    
+    kernel = _binary_confusion_kernel()
+    if kernel is None:
+        from sklearn.metrics import confusion_matrix
+        return tuple(confusion_matrix(y_true, y_pred, labels=classes).ravel())
+    
+    positive = classes[1]
+    y_true = (np.asarray(y_true) == positive).view(np.int8)
+    y_pred = (np.asarray(y_pred) == positive).view(np.int8)
+    tp, fp, fn, tn = kernel(y_true, y_pred)
+    return tn, fp, fn, tp
 
 
 def evaluate_model(
@@ -43,19 +104,36 @@ def evaluate_model(
         Dictionary containing evaluation metrics
     """
     try:
+        # scikit-learn is imported on first use to keep module import cheap
+        from sklearn.metrics import (
+            accuracy_score, precision_score, recall_score, f1_score,
+            roc_auc_score, mean_squared_error, mean_absolute_error, r2_score
+        )
+        
         y_pred = model.predict(X_test)
         
         if task == "classification":
             # Handle binary vs multiclass classification
-            if len(np.unique(y_test)) == 2:
+            classes = np.unique(y_test)
+            if len(classes) == 2:
                 # Binary classification
                 y_pred_proba = model.predict_proba(X_test)[:, 1] if hasattr(model, 'predict_proba') else None
                 
+                # Class 1 is the positive class, as with sklearn's default pos_label
+                if 1 not in classes:
+                    raise ValueError(f"pos_label=1 is not a valid label. It should be one of {classes}")
+                classes = np.array([classes[classes != 1][0], 1], dtype=classes.dtype)
+                
+                # Derive all metrics from a single confusion matrix pass
+                tn, fp, fn, tp = _binary_confusion(y_test, y_pred, classes)
+                precision = tp / (tp + fp) if tp + fp else 0.0
+                recall = tp / (tp + fn) if tp + fn else 0.0
+                
                 metrics = {
-                    'accuracy': accuracy_score(y_test, y_pred),
-                    'precision': precision_score(y_test, y_pred, average='binary'),
-                    'recall': recall_score(y_test, y_pred, average='binary'),
-                    'f1': f1_score(y_test, y_pred, average='binary'),
+                    'accuracy': float((tp + tn) / (tp + tn + fp + fn)),
+                    'precision': float(precision),
+                    'recall': float(recall),
+                    'f1': float(2 * precision * recall / (precision + recall)) if precision + recall else 0.0,
                 }
                 
                 if y_pred_proba is not None:
@@ -74,9 +152,10 @@ def evaluate_model(
                 }
                 
         elif task == "regression":
+            mse = mean_squared_error(y_test, y_pred)
             metrics = {
-                'mse': mean_squared_error(y_test, y_pred),
-                'rmse': np.sqrt(mean_squared_error(y_test, y_pred)),
+                'mse': mse,
+                'rmse': np.sqrt(mse),
                 'mae': mean_absolute_error(y_test, y_pred),
                 'r2': r2_score(y_test, y_pred),
             }
@@ -107,6 +186,7 @@ def cross_validate(
     cv: int = 5,
     scoring: Union[str, List[str]] = "default",
     task: str = "classification",
+    n_jobs: int = -1,
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -119,12 +199,16 @@ def cross_validate(
         cv: Number of cross-validation folds
         scoring: Scoring metric(s) to use
         task: Task type ("classification" or "regression")
+        n_jobs: Number of folds evaluated in parallel (-1 uses all cores;
+            pass 1 for estimators that already parallelize internally)
         **kwargs: Additional arguments for cross_val_score
         
     Returns:
         Dictionary containing cross-validation results
     """
     try:
+        from sklearn.model_selection import cross_val_score, StratifiedKFold
+        
         # Set default scoring based on task
         if scoring == "default":
             if task == "classification":
@@ -132,9 +216,15 @@ def cross_validate(
             elif task == "regression":
                 scoring = "r2"
         
+        # Build the fold splitter once
+        if task == "classification" and isinstance(cv, int):
+            splitter = StratifiedKFold(n_splits=cv, shuffle=True, random_state=42)
+        else:
+            splitter = cv
+        
         # Perform cross-validation
         cv_scores = cross_val_score(
-            model, X, y, cv=cv, scoring=scoring, **kwargs
+            model, X, y, cv=splitter, scoring=scoring, n_jobs=n_jobs, **kwargs
         )
         
         results = {
@@ -156,10 +246,37 @@ def cross_validate(
         raise
 
 
+def _fit_state(model) -> Tuple[tuple, List[Any]]:
+    """
+    Fingerprint the current fit of a model by its fitted attributes.
+    
+    scikit-learn stores fit results in public attributes with a trailing
+    underscore and rebinds them on every fit, so their identities (plus
+    shape/length, for in-place growth such as warm_start) change on refit.
+    
+    Args:
+        model: Trained scikit-learn model
+        
+    Returns:
+        Hashable fingerprint and the attribute values it refers to
+    """
+    fitted = sorted(
+        (name, value) for name, value in getattr(model, '__dict__', {}).items()
+        if name.endswith('_') and not name.startswith('_')
+    )
+    fingerprint = tuple(
+        (name, id(value), len(value) if isinstance(value, list) else getattr(value, 'shape', None))
+        for name, value in fitted
+    )
+    return fingerprint, [value for _, value in fitted]
+
+
 def feature_importance(
     model,
     feature_names: Optional[List[str]] = None,
     method: str = "default",
+    top_k: Optional[int] = None,
+    cache: bool = True,
     **kwargs
 ) -> pd.DataFrame:
     """
@@ -169,21 +286,38 @@ def feature_importance(
         model: Trained scikit-learn model
         feature_names: List of feature names (uses default if None)
         method: Method to extract importance ("default", "permutation", "shap")
+        top_k: Return only the k most important features (all if None)
+        cache: Reuse the result of a previous call for the same fitted model.
+            Refitting the model (which rebinds its fitted attributes)
+            invalidates the entry.
         **kwargs: Additional arguments for specific methods
         
     Returns:
         DataFrame with feature names and importance scores
     """
+    cache_key = None
+    if cache:
+        fit_state, fitted_values = _fit_state(model)
+        cache_key = (
+            id(model), fit_state, method,
+            tuple(feature_names) if feature_names is not None else None, top_k
+        )
+        cached = _FI_CACHE.get(cache_key)
+        if cached is not None:
+            _FI_CACHE.move_to_end(cache_key)
+            return cached[2].copy()
+    
     try:
         if method == "default":
             # Try to get feature_importances_ attribute
             if hasattr(model, 'feature_importances_'):
                 importance_scores = model.feature_importances_
             elif hasattr(model, 'coef_'):
-                # For linear models, use absolute coefficients
-                importance_scores = np.abs(model.coef_)
+                # For linear models, use absolute coefficients (averaged over classes);
+                # abs and the float32 cast share one temporary
+                importance_scores = np.abs(model.coef_, dtype=np.float32)
                 if importance_scores.ndim > 1:
-                    importance_scores = np.mean(importance_scores, axis=0)
+                    importance_scores = importance_scores.mean(axis=0)
             else:
                 raise ValueError("Model doesn't have feature_importances_ or coef_ attributes")
                 
@@ -193,10 +327,10 @@ def feature_importance(
                 from sklearn.inspection import permutation_importance
                 # This would require X and y, so we'll use default method
                 logger.warning("Permutation importance requires X and y data, using default method")
-                return feature_importance(model, feature_names, method="default")
+                return feature_importance(model, feature_names, method="default", top_k=top_k)
             except ImportError:
                 logger.warning("Permutation importance not available, using default method")
-                return feature_importance(model, feature_names, method="default")
+                return feature_importance(model, feature_names, method="default", top_k=top_k)
                 
         else:
             raise ValueError(f"Unsupported method: {method}")
@@ -205,14 +339,38 @@ def feature_importance(
         if feature_names is None:
             feature_names = [f"feature_{i}" for i in range(len(importance_scores))]
         
-        # Create DataFrame
-        importance_df = pd.DataFrame({
-            'feature': feature_names,
-            'importance': importance_scores
-        }).sort_values('importance', ascending=False)
+        importance_scores = np.asarray(importance_scores, dtype=np.float32)
+        n_features = len(importance_scores)
+        if len(feature_names) != n_features:
+            raise ValueError(
+                f"Got {len(feature_names)} feature names for {n_features} importance scores"
+            )
+        total = importance_scores.sum()
+        
+        # Order by descending importance; partial sort when only top_k is needed
+        if top_k is not None and top_k < n_features:
+            order = np.argpartition(-importance_scores, top_k)[:top_k]
+            order = order[np.argsort(-importance_scores[order], kind='stable')]
+        elif np.all(np.diff(importance_scores) <= 0):
+            order = np.arange(n_features)
+        else:
+            order = np.argsort(-importance_scores, kind='stable')
         
-        # Add percentage
-        importance_df['importance_pct'] = (importance_df['importance'] / importance_df['importance'].sum()) * 100
+        # Create DataFrame with percentage of total importance
+        top_scores = importance_scores[order]
+        importance_df = pd.DataFrame({
+            'feature': np.asarray(feature_names, dtype=object)[order],
+            'importance': top_scores,
+            'importance_pct': top_scores * (100.0 / total) if total else np.nan
+        }, index=order)
+        
+        if cache_key is not None:
+            # Keep the model and its fitted attributes alive so their ids
+            # cannot be reused by other objects
+            _FI_CACHE[cache_key] = (model, fitted_values, importance_df)
+            if len(_FI_CACHE) > _FI_CACHE_SIZE:
+                _FI_CACHE.popitem(last=False)
+            importance_df = importance_df.copy()
         
         logger.info(f"Feature importance extracted using {method} method")
         return importance_df
@@ -230,8 +388,10 @@ def prepare_data_for_ml(
     test_size: float = 0.2,
     random_state: int = 42,
     scale_numeric: bool = True,
-    encode_categorical: bool = True
-) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+    encode_categorical: bool = True,
+    dtype: Any = np.float32,
+    return_blocks: bool = False
+) -> Tuple[Any, Any, np.ndarray, np.ndarray, Dict[str, Any]]:
     """
     Prepare data for machine learning tasks.
     
@@ -244,62 +404,96 @@ def prepare_data_for_ml(
         random_state: Random seed for reproducibility
         scale_numeric: Whether to scale numeric features
         encode_categorical: Whether to encode categorical features
+        dtype: Floating dtype of the feature arrays. Defaults to float32,
+            which scikit-learn estimators accept and which halves memory;
+            pass np.float64 for models that require double precision.
+        return_blocks: Return X_train and X_test as (X_numeric, X_categorical)
+            tuples instead of one stacked array, e.g. for gradient-boosted
+            tree libraries that take the blocks separately
         
     Returns:
-        Tuple of (X_train, X_test, y_train, y_test, preprocessing_info)
+        Tuple of (X_train, X_test, y_train, y_test, preprocessing_info).
+        X_train and X_test have the requested dtype unless unencoded
+        categorical columns force an object array; numeric columns come
+        first, followed by categorical ones.
+        preprocessing_info['label_encoders'] maps each categorical column
+        to the Index of its categories; a value's position is its code.
     """
     try:
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+        
         # Identify columns if not specified
+        if categorical_columns is None or numeric_columns is None:
+            detected_numeric, detected_categorical, _ = _split_by_kind(data.dtypes)
+        
         if categorical_columns is None:
-            categorical_columns = list(data.select_dtypes(include=['object', 'category']).columns)
+            categorical_columns = detected_categorical
             if target_column in categorical_columns:
                 categorical_columns.remove(target_column)
                 
         if numeric_columns is None:
-            numeric_columns = list(data.select_dtypes(include=[np.number]).columns)
+            numeric_columns = detected_numeric
             if target_column in numeric_columns:
                 numeric_columns.remove(target_column)
         
-        # Create feature matrix
-        X = data[numeric_columns + categorical_columns].copy()
         y = data[target_column]
-        
-        # Handle missing values
-        X = X.fillna(X.median() if numeric_columns else X.mode().iloc[0])
-        
+        n_samples = len(data)
         preprocessing_info = {}
         
-        # Encode categorical variables
-        if encode_categorical and categorical_columns:
+        # Numeric block: one contiguous array, NaNs filled with column medians
+        X_num = data[numeric_columns].to_numpy(dtype=dtype, na_value=np.nan)
+        if numeric_columns:
+            nan_rows, nan_cols = np.nonzero(np.isnan(X_num))
+            if nan_rows.size:
+                X_num[nan_rows, nan_cols] = np.nanmedian(X_num, axis=0)[nan_cols]
+        
+        # Categorical block: missing values become a sentinel category
+        if encode_categorical:
+            # Sorted categories give the same codes LabelEncoder would
+            X_cat = np.empty((n_samples, len(categorical_columns)), dtype=np.int32)
             label_encoders = {}
-            for col in categorical_columns:
-                le = LabelEncoder()
-                X[col] = le.fit_transform(X[col].astype(str))
-                label_encoders[col] = le
-            preprocessing_info['label_encoders'] = label_encoders
+            for j, col in enumerate(categorical_columns):
+                encoded = data[col].astype(object).fillna('__NA__').astype(str).astype('category')
+                X_cat[:, j] = encoded.cat.codes
+                label_encoders[col] = encoded.cat.categories
+            if categorical_columns:
+                preprocessing_info['label_encoders'] = label_encoders
+        else:
+            X_cat = data[categorical_columns].astype(object).fillna('__NA__').to_numpy()
         
-        # Scale numeric features
+        # Scale numeric features in place
         if scale_numeric and numeric_columns:
-            scaler = StandardScaler()
-            X[numeric_columns] = scaler.fit_transform(X[numeric_columns])
+            scaler = StandardScaler(copy=False)
+            X_num = scaler.fit_transform(X_num)
             preprocessing_info['scaler'] = scaler
         
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=random_state, stratify=y if len(y.unique()) <= 10 else None
+        # Stratify on low-cardinality targets; float targets are treated as regression
+        if pd.api.types.is_float_dtype(y):
+            stratify = None
+        else:
+            stratify = y if y.nunique(dropna=False) <= 10 else None
+        
+        # Split both blocks with the same row permutation
+        X_num_train, X_num_test, X_cat_train, X_cat_test, y_train, y_test = train_test_split(
+            X_num, X_cat, y, test_size=test_size, random_state=random_state, stratify=stratify
         )
+        y_train = y_train.to_numpy(copy=False)
+        y_test = y_test.to_numpy(copy=False)
         
-        # Convert to numpy arrays
-        X_train = X_train.values
-        X_test = X_test.values
-        y_train = y_train.values
-        y_test = y_test.values
+        if return_blocks:
+            X_train = (X_num_train, X_cat_train)
+            X_test = (X_num_test, X_cat_test)
+        else:
+            X_dtype = dtype if encode_categorical or not categorical_columns else object
+            X_train = _stack_blocks(X_num_train, X_cat_train, X_dtype)
+            X_test = _stack_blocks(X_num_test, X_cat_test, X_dtype)
         
-        preprocessing_info['feature_names'] = X.columns.tolist()
+        preprocessing_info['feature_names'] = numeric_columns + categorical_columns
         preprocessing_info['categorical_columns'] = categorical_columns
         preprocessing_info['numeric_columns'] = numeric_columns
         
-        logger.info(f"Data prepared: {X_train.shape[0]} training samples, {X_test.shape[0]} test samples")
+        logger.info(f"Data prepared: {len(y_train)} training samples, {len(y_test)} test samples")
         return X_train, X_test, y_train, y_test, preprocessing_info
         
     except Exception as e:
@@ -307,6 +501,15 @@ def prepare_data_for_ml(
         raise
 
 
+def _stack_blocks(X_num: np.ndarray, X_cat: np.ndarray, dtype: Any) -> np.ndarray:
+    """Stack numeric and categorical blocks column-wise into one array of the given dtype."""
+    n_numeric = X_num.shape[1]
+    X = np.empty((X_num.shape[0], n_numeric + X_cat.shape[1]), dtype=dtype)
+    X[:, :n_numeric] = X_num
+    X[:, n_numeric:] = X_cat
+    return X
+
+
 def create_model_summary(
     model,
     X_train: np.ndarray,
@@ -5,17 +5,114 @@ This module provides functions for creating, customizing, and saving plots
 across different projects.
 """
 
+import hashlib
+import os
+from collections import OrderedDict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import matplotlib
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import matplotlib.font_manager
+import matplotlib.lines
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from PIL import Image
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Union, Optional, Dict, Any, List, Tuple
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging; handlers and levels are left to the host application
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Raster formats written through the Agg buffer + Pillow fast path
+_RASTER_FORMATS = {'png': 'PNG', 'jpg': 'JPEG', 'jpeg': 'JPEG'}
+
+# Resolved rcParams per (style, context, palette, font_scale); only the
+# parameters the style actually sets are stored, so replaying an entry leaves
+# unrelated user settings alone
+_STYLE_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# rcParams that plt.style.use ignores because they are not about style
+# (mirrors matplotlib's own list, which is not public API)
+_NON_STYLE_PARAMS = frozenset({
+    'backend', 'backend_fallback', 'date.epoch', 'docstring.hardcopy',
+    'figure.max_open_warning', 'figure.raise_window', 'interactive',
+    'savefig.directory', 'timezone', 'tk.window_focus', 'toolbar',
+    'webagg.address', 'webagg.open_in_browser', 'webagg.port',
+    'webagg.port_retries',
+})
+
+# Project-wide overrides applied on top of the matplotlib and seaborn styles
+_STYLE_OVERRIDES = {
+    'figure.figsize': (12, 8),
+    'figure.dpi': 100,
+    'savefig.dpi': 300,
+    'font.size': 12,
+    'axes.titlesize': 14,
+    'axes.labelsize': 12,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 10,
+}
+
+# LRU cache of correlation matrices, keyed by a content fingerprint of the data
+_CORR_CACHE: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_CORR_CACHE_SIZE = 32
+
+
+class _FigurePool:
+    """
+    Thread-local pool of off-screen Agg figures.
+    
+    Pooled figures bypass pyplot's figure manager entirely; a released
+    figure is cleared and handed out again instead of allocating a new
+    Figure and canvas.
+    """
+    
+    _local = threading.local()
+    max_size = 8
+    
+    @classmethod
+    def _free(cls) -> List[Figure]:
+        if not hasattr(cls._local, 'free'):
+            cls._local.free = []
+        return cls._local.free
+    
+    @classmethod
+    def acquire(cls, figsize: Tuple[float, float]) -> Figure:
+        """Return an empty pooled figure of the given size."""
+        free = cls._free()
+        if free:
+            fig = free.pop()
+            fig.clear()
+            fig.set_size_inches(figsize)
+        else:
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+            fig._pooled = True
+        return fig
+    
+    @classmethod
+    def release(cls, fig: Figure) -> None:
+        """Return a pooled figure to the pool, or close a pyplot figure."""
+        if getattr(fig, '_pooled', False):
+            free = cls._free()
+            if fig not in free and len(free) < cls.max_size:
+                free.append(fig)
+        else:
+            plt.close(fig)
+
+
+def _new_figure(figsize: Tuple[float, float], reuse_figure: bool = False) -> Figure:
+    """Create a pyplot figure, or take one from the figure pool."""
+    if reuse_figure:
+        return _FigurePool.acquire(figsize)
+    return plt.figure(figsize=figsize)
 
 
 def set_plot_style(
@@ -27,33 +124,127 @@ def set_plot_style(
     """
     Set consistent plotting style across all visualizations.
     
+    The resulting rcParams are resolved once per argument combination and
+    re-applied with a single bulk update on later calls.
+    
     Args:
         style: Matplotlib style to use
         context: Seaborn context (paper, notebook, talk, poster)
         palette: Color palette for plots
         font_scale: Font size scaling factor
     """
+    key = (style, context, palette, font_scale)
+    try:
+        params = _STYLE_CACHE.get(key)
+    except TypeError:
+        # Unhashable style (a dict or list of styles) bypasses the cache
+        key = params = None
+    names = None
+    if params is None and key is not None:
+        names = _style_param_names(style, context, font_scale)
+    
+    if params is None and names is None:
+        # Style we cannot cache or enumerate up front: apply it directly
+        _apply_plot_style(style, context, palette, font_scale)
+    else:
+        if params is None:
+            # Resolve the style once inside a throwaway context and keep the result
+            with matplotlib.rc_context():
+                _apply_plot_style(style, context, palette, font_scale)
+                params = {name: plt.rcParams[name] for name in names}
+            _STYLE_CACHE[key] = params
+        
+        # One bulk update instead of re-resolving the style on every call
+        plt.rcParams.update(params)
+    
+    logger.info(f"Plot style set: {style}, context: {context}, palette: {palette}")
+
+
+def _style_param_names(style: Any, context: str, font_scale: float) -> Optional[set]:
+    """
+    Return the names of the rcParams that _apply_plot_style sets.
+    
+    Covers the matplotlib style (a library name, "default", a style file or
+    a tuple of these), the seaborn context and palette, and the project
+    overrides. Returns None for style sources that cannot be enumerated
+    without applying them (e.g. dotted package styles).
+    """
+    styles = [style] if isinstance(style, (str, Path)) else list(style)
+    names = set()
+    for entry in styles:
+        if not isinstance(entry, (str, Path)):
+            return None
+        elif entry == 'default':
+            names.update(matplotlib.rcParamsDefault)
+        elif isinstance(entry, str) and entry in plt.style.library:
+            names.update(plt.style.library[entry])
+        else:
+            try:
+                names.update(matplotlib.rc_params_from_file(entry, use_default_template=False))
+            except (OSError, TypeError):
+                return None
+    
+    names.update(_sns().plotting_context(context, font_scale=font_scale))
+    names.add('axes.prop_cycle')
+    names.update(_STYLE_OVERRIDES)
+    return names - _NON_STYLE_PARAMS
+
+
+@lru_cache(maxsize=None)
+def _sns():
+    """
+    Import seaborn on first use.
+    
+    seaborn is slow to import and only the seaborn-backed plot types and
+    set_plot_style need it, so the module does not import it up front.
+    """
+    import seaborn as sns
+    return sns
+
+
+def _apply_plot_style(
+    style: str,
+    context: str,
+    palette: str,
+    font_scale: float
+) -> None:
+    """Apply the project plotting style to the current rcParams."""
     # Set matplotlib style
     plt.style.use(style)
     
     # Set seaborn context and style
+    sns = _sns()
     sns.set_context(context, font_scale=font_scale)
     sns.set_palette(palette)
     
-    # Set default figure size and DPI
-    plt.rcParams['figure.figsize'] = (12, 8)
-    plt.rcParams['figure.dpi'] = 100
-    plt.rcParams['savefig.dpi'] = 300
-    
-    # Set font properties
-    plt.rcParams['font.size'] = 12
-    plt.rcParams['axes.titlesize'] = 14
-    plt.rcParams['axes.labelsize'] = 12
-    plt.rcParams['xtick.labelsize'] = 10
-    plt.rcParams['ytick.labelsize'] = 10
-    plt.rcParams['legend.fontsize'] = 10
-    
-    logger.info(f"Plot style set: {style}, context: {context}, palette: {palette}")
+    # Set default figure size, DPI and font properties
+    plt.rcParams.update(_STYLE_OVERRIDES)
+
+
+# Axes-level plot types for create_plot, all called as
+# draw(data, x, y, hue, ax, **kwargs); pairplot builds its own figure.
+_PLOT_DISPATCH = {
+    "histogram": lambda data, x, y, hue, ax, **kwargs: _sns().histplot(
+        data=data, x=x, hue=hue, ax=ax, **kwargs),
+    "boxplot": lambda data, x, y, hue, ax, **kwargs: _sns().boxplot(
+        data=data, x=x, y=y, hue=hue, ax=ax, **kwargs),
+    "scatter": lambda data, x, y, hue, ax, **kwargs: _sns().scatterplot(
+        data=data, x=x, y=y, hue=hue, ax=ax, **kwargs),
+    "line": lambda data, x, y, hue, ax, **kwargs: _sns().lineplot(
+        data=data, x=x, y=y, hue=hue, ax=ax, **kwargs),
+    "bar": lambda data, x, y, hue, ax, **kwargs: _sns().barplot(
+        data=data, x=x, y=y, hue=hue, ax=ax, **kwargs),
+    "violin": lambda data, x, y, hue, ax, **kwargs: _sns().violinplot(
+        data=data, x=x, y=y, hue=hue, ax=ax, **kwargs),
+    "heatmap": lambda data, x, y, hue, ax, **kwargs: _sns().heatmap(
+        data, ax=ax, **kwargs),
+}
+
+
+@lru_cache(maxsize=1024)
+def _axis_label(column: str) -> str:
+    """Turn a column name like 'total_price' into an axis label 'Total Price'."""
+    return column.replace('_', ' ').title()
 
 
 def create_plot(
@@ -62,6 +253,7 @@ def create_plot(
     x: Optional[str] = None,
     y: Optional[str] = None,
     hue: Optional[str] = None,
+    reuse_figure: bool = False,
     **kwargs
 ) -> plt.Figure:
     """
@@ -73,41 +265,42 @@ def create_plot(
         x: Column name for x-axis
         y: Column name for y-axis
         hue: Column name for color grouping
+        reuse_figure: Draw on a recycled off-screen figure from the figure
+            pool instead of a new pyplot figure (see save_plot(release=True))
         **kwargs: Additional arguments for the plot
         
     Returns:
         Matplotlib Figure object
     """
-    fig, ax = plt.subplots(figsize=(12, 8))
-    
     try:
-        if plot_type == "histogram":
-            sns.histplot(data=data, x=x, hue=hue, **kwargs)
-        elif plot_type == "boxplot":
-            sns.boxplot(data=data, x=x, y=y, hue=hue, **kwargs)
-        elif plot_type == "scatter":
-            sns.scatterplot(data=data, x=x, y=y, hue=hue, **kwargs)
-        elif plot_type == "line":
-            sns.lineplot(data=data, x=x, y=y, hue=hue, **kwargs)
-        elif plot_type == "bar":
-            sns.barplot(data=data, x=x, y=y, hue=hue, **kwargs)
-        elif plot_type == "violin":
-            sns.violinplot(data=data, x=x, y=y, hue=hue, **kwargs)
-        elif plot_type == "heatmap":
-            sns.heatmap(data, **kwargs)
-        elif plot_type == "pairplot":
-            return sns.pairplot(data, hue=hue, **kwargs)
-        else:
+        if plot_type == "pairplot":
+            # Seaborn-specific options (kind, vars, corner, ...) need PairGrid,
+            # and a numeric hue needs seaborn's continuous color mapping
+            numeric_hue = (
+                hue is not None
+                and pd.api.types.is_numeric_dtype(data[hue])
+                and not pd.api.types.is_bool_dtype(data[hue])
+            )
+            if kwargs or numeric_hue:
+                return _sns().pairplot(data, hue=hue, **kwargs).figure
+            return _pairplot(data, hue, reuse_figure)
+        
+        draw = _PLOT_DISPATCH.get(plot_type)
+        if draw is None:
             raise ValueError(f"Unsupported plot type: {plot_type}")
+        
+        fig = _new_figure((12, 8), reuse_figure)
+        ax = fig.subplots()
+        draw(data, x, y, hue, ax, **kwargs)
             
         # Improve plot appearance
         ax.set_title(f"{plot_type.title()} Plot", fontsize=16, fontweight='bold')
         if x:
-            ax.set_xlabel(x.replace('_', ' ').title(), fontsize=12)
+            ax.set_xlabel(_axis_label(x), fontsize=12)
         if y:
-            ax.set_ylabel(y.replace('_', ' ').title(), fontsize=12)
+            ax.set_ylabel(_axis_label(y), fontsize=12)
             
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
         
     except Exception as e:
@@ -120,17 +313,26 @@ def save_plot(
     file_path: Union[str, Path],
     format: str = "png",
     dpi: int = 300,
-    bbox_inches: str = "tight"
+    bbox_inches: str = "tight",
+    release: bool = False,
+    png_compress_level: int = 1
 ) -> None:
     """
     Save plot to file with consistent settings.
     
+    PNG and JPEG are rendered once with Agg and encoded by Pillow with
+    fast compression; vector formats go through fig.savefig.
+    
     Args:
         fig: Matplotlib Figure object to save
         file_path: Path where to save the plot
         format: Output format (png, pdf, svg, jpg)
         dpi: Resolution for raster formats
         bbox_inches: Bounding box setting
+        release: Free the figure after saving; pooled figures go back to the
+            figure pool, pyplot figures are closed. Do not use fig afterwards.
+        png_compress_level: zlib level for PNG output, from 0 (fastest,
+            largest) to 9 (slowest, smallest)
     """
     file_path = Path(file_path)
     
@@ -138,27 +340,149 @@ def save_plot(
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
     try:
-        fig.savefig(
-            file_path,
-            format=format,
-            dpi=dpi,
-            bbox_inches=bbox_inches,
-            facecolor='white',
-            edgecolor='none'
-        )
+        pixels = None
+        if format.lower() in _RASTER_FORMATS and bbox_inches in (None, 'tight'):
+            pixels = _render_rgba(fig, dpi, tight=bbox_inches == 'tight')
+        if pixels is not None:
+            image = Image.fromarray(pixels)
+            pil_format = _RASTER_FORMATS[format.lower()]
+            if pil_format == 'JPEG':
+                image = image.convert('RGB')
+                options = {'quality': 85, 'progressive': False}
+            else:
+                options = {'compress_level': png_compress_level}
+            image.save(file_path, format=pil_format, dpi=(dpi, dpi), optimize=False, **options)
+        else:
+            fig.savefig(
+                file_path,
+                format=format,
+                dpi=dpi,
+                bbox_inches=bbox_inches,
+                facecolor='white',
+                edgecolor='none'
+            )
         logger.info(f"Plot saved successfully to {file_path}")
         
+        if release:
+            _FigurePool.release(fig)
+        
     except Exception as e:
         logger.error(f"Error saving plot to {file_path}: {e}")
         raise
 
 
+def _render_rgba(fig: plt.Figure, dpi: int, tight: bool = True) -> Optional[np.ndarray]:
+    """
+    Render a figure with Agg on a white background and return its pixels.
+    
+    The figure's own canvas, dpi and colors are restored afterwards, so this
+    works with any active backend (including notebook inline display).
+    
+    Args:
+        fig: Matplotlib Figure object to render
+        dpi: Resolution to render at
+        tight: Crop to the tight bounding box plus savefig.pad_inches,
+            like savefig(bbox_inches="tight")
+        
+    Returns:
+        Array of shape (height, width, 4) with uint8 RGBA pixels, or None
+        when tight is set and artists reach outside the figure (e.g. a
+        legend anchored beside the axes); savefig has to grow the canvas
+        for those, which cropping cannot reproduce
+    """
+    original_canvas = fig.canvas
+    original_dpi = fig.get_dpi()
+    original_facecolor = fig.get_facecolor()
+    original_edgecolor = fig.get_edgecolor()
+    try:
+        # Swap in the Agg canvas before touching dpi, as savefig does; setting
+        # dpi on the original canvas would resize a GUI window on every save
+        canvas = FigureCanvasAgg(fig)
+        fig.set_dpi(dpi)
+        fig.set_facecolor('white')
+        fig.set_edgecolor('none')
+        canvas.draw()
+        image = np.asarray(canvas.buffer_rgba())
+        
+        if tight:
+            bbox = fig.get_tightbbox(canvas.get_renderer())
+            fig_width, fig_height = fig.get_size_inches()
+            if bbox.x0 < 0 or bbox.y0 < 0 or bbox.x1 > fig_width or bbox.y1 > fig_height:
+                return None
+            bbox = bbox.padded(plt.rcParams['savefig.pad_inches'])
+            height, width = image.shape[:2]
+            # savefig renders the padded bbox onto a canvas of int(size * dpi)
+            # pixels; crop the same number of pixels starting at its corner
+            out_width = int(bbox.width * dpi)
+            out_height = int(bbox.height * dpi)
+            left = int(round(bbox.x0 * dpi))
+            bottom = height - int(round(bbox.y0 * dpi))
+            right = left + out_width
+            top = bottom - out_height
+            image = image[max(top, 0):min(bottom, height), max(left, 0):min(right, width)]
+            # Padding that falls outside the figure is blank, as in savefig
+            image = np.pad(
+                image,
+                ((max(-top, 0), max(bottom - height, 0)), (max(-left, 0), max(right - width, 0)), (0, 0)),
+                constant_values=255
+            )
+        
+        return image.copy()
+    finally:
+        # Restore dpi while the Agg canvas is still attached, for the same reason
+        fig.set_dpi(original_dpi)
+        fig.set_canvas(original_canvas)
+        fig.set_facecolor(original_facecolor)
+        fig.set_edgecolor(original_edgecolor)
+
+
+def _compute_corr(
+    numeric_data: pd.DataFrame,
+    method: str,
+    precision: str = "float64"
+) -> pd.DataFrame:
+    """
+    Compute a correlation matrix, using one BLAS matrix product when possible.
+    
+    Pearson and Spearman on data without missing values are computed as a
+    single GEMM over centered (ranked, for Spearman) columns. Missing values
+    need pairwise-complete observations and Kendall has no GEMM form, so
+    those cases fall back to DataFrame.corr.
+    
+    Args:
+        numeric_data: DataFrame with numeric columns only
+        method: Correlation method (pearson, spearman, kendall)
+        precision: Floating dtype of the GEMM and of the result
+        
+    Returns:
+        Correlation matrix as a DataFrame indexed by column names
+    """
+    if method not in ('pearson', 'spearman') or numeric_data.isna().to_numpy().any():
+        return numeric_data.corr(method=method).astype(precision)
+    
+    if method == 'spearman':
+        numeric_data = numeric_data.rank()
+    # Center in float64 before narrowing: casting first would wipe out the
+    # variance of columns with a large offset (e.g. timestamps)
+    X = numeric_data.to_numpy(dtype=np.float64)
+    X = (X - X.mean(axis=0)).astype(precision, copy=False)
+    norms = np.sqrt(np.einsum('ij,ij->j', X, X))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = (X.T @ X) / np.outer(norms, norms)
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, np.where(norms > 0, 1.0, np.nan))
+    
+    return pd.DataFrame(corr, index=numeric_data.columns, columns=numeric_data.columns)
+
+
 def create_correlation_heatmap(
     data: pd.DataFrame,
     method: str = "pearson",
     figsize: Tuple[int, int] = (10, 8),
     annot: bool = True,
-    cmap: str = "coolwarm"
+    cmap: str = "coolwarm",
+    reuse_figure: bool = False,
+    precision: str = "float32"
 ) -> plt.Figure:
     """
     Create a correlation heatmap for numeric columns.
@@ -169,41 +493,365 @@ def create_correlation_heatmap(
         figsize: Figure size as (width, height)
         annot: Whether to show correlation values
         cmap: Color map for the heatmap
+        reuse_figure: Draw on a recycled off-screen figure from the figure pool
+        precision: Floating dtype for the correlation computation, "float32"
+            (faster, plenty for a plot) or "float64"
         
     Returns:
         Matplotlib Figure object
     """
+    if precision not in ("float32", "float64"):
+        raise ValueError(f"Unsupported precision: {precision}")
+    
     # Select only numeric columns
     numeric_data = data.select_dtypes(include=[np.number])
     
     if numeric_data.empty:
         raise ValueError("No numeric columns found in the data")
     
-    # Calculate correlation matrix
-    corr_matrix = numeric_data.corr(method=method)
-    
-    # Create heatmap
-    fig, ax = plt.subplots(figsize=figsize)
-    sns.heatmap(
-        corr_matrix,
-        annot=annot,
-        cmap=cmap,
-        center=0,
-        square=True,
-        linewidths=0.5,
-        cbar_kws={"shrink": 0.8}
+    # Calculate correlation matrix (cached, so cosmetic changes skip this step)
+    corr_matrix = _cached_corr(numeric_data, method, precision)
+    
+    return _render_corr_heatmap(corr_matrix, method, figsize, annot, cmap, reuse_figure)
+
+
+def _cached_corr(
+    numeric_data: pd.DataFrame,
+    method: str,
+    precision: str = "float64"
+) -> pd.DataFrame:
+    """
+    Return the correlation matrix of numeric_data, reusing earlier results.
+    
+    The key is the column names, dtypes, method, precision and a digest of
+    pandas' per-row value hashes, so an edited frame never hits a stale entry.
+    
+    Args:
+        numeric_data: DataFrame with numeric columns only
+        method: Correlation method (pearson, spearman, kendall)
+        precision: Floating dtype of the computation and of the result
+        
+    Returns:
+        Correlation matrix as a DataFrame (a copy of the cached one)
+    """
+    row_hashes = pd.util.hash_pandas_object(numeric_data, index=False).to_numpy()
+    key = (
+        method,
+        precision,
+        tuple(numeric_data.columns),
+        tuple(str(dtype) for dtype in numeric_data.dtypes),
+        hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+    )
+    
+    corr_matrix = _CORR_CACHE.get(key)
+    if corr_matrix is not None:
+        _CORR_CACHE.move_to_end(key)
+    else:
+        corr_matrix = _compute_corr(numeric_data, method, precision)
+        _CORR_CACHE[key] = corr_matrix
+        if len(_CORR_CACHE) > _CORR_CACHE_SIZE:
+            _CORR_CACHE.popitem(last=False)
+    return corr_matrix.copy()
+
+
+def _render_corr_heatmap(
+    corr_matrix: pd.DataFrame,
+    method: str,
+    figsize: Tuple[int, int],
+    annot: bool,
+    cmap: str,
+    reuse_figure: bool = False
+) -> plt.Figure:
+    """
+    Draw a precomputed correlation matrix as a heatmap figure.
+    
+    Uses a single pcolormesh (QuadMesh) instead of seaborn's heatmap; cell
+    annotations are skipped automatically above 50 columns.
+    """
+    values = corr_matrix.to_numpy()
+    k = values.shape[0]
+    labels = [str(col) for col in corr_matrix.columns]
+    centers = np.arange(k) + 0.5
+    
+    fig = _new_figure(figsize, reuse_figure)
+    ax = fig.subplots()
+    mesh = ax.pcolormesh(
+        values, cmap=cmap, vmin=-1, vmax=1, edgecolors='white', linewidth=0.5
     )
+    ax.set_xlim(0, k)
+    ax.set_ylim(k, 0)
+    ax.set_aspect('equal')
+    ax.set_xticks(centers, labels=labels, rotation=90)
+    ax.set_yticks(centers, labels=labels)
+    ax.tick_params(length=0)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    colorbar = fig.colorbar(mesh, ax=ax, shrink=0.8)
+    colorbar.outline.set_linewidth(0)
+    
+    if annot and k <= 50:
+        # Dark text on light cells and vice versa, as seaborn does
+        rgb = mesh.cmap(mesh.norm(values))[..., :3]
+        luminance = rgb @ np.array([0.2126, 0.7152, 0.0722])
+        text = np.char.mod('%.2f', values)
+        # NaN cells (e.g. constant columns) are left blank, as in seaborn
+        for i, j in zip(*np.nonzero(~np.isnan(values))):
+            ax.text(
+                j + 0.5, i + 0.5, text[i, j], ha='center', va='center',
+                color='.15' if luminance[i, j] > 0.408 else 'w'
+            )
     
     ax.set_title(f"Correlation Matrix ({method.title()})", fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    # Tick labels are the only variable-size element, so size margins from them
+    label_inches = _text_width_inches(max(map(len, labels)), 'xtick.labelsize')
+    fig.subplots_adjust(**_fixed_layout(
+        tuple(fig.get_size_inches()), 1, 1,
+        left=label_inches + 0.3, right=0.2, top=0.6, bottom=label_inches + 0.3
+    ))
     
     return fig
 
 
+def _text_width_inches(n_chars: int, size_param: str) -> float:
+    """Estimate the rendered width of n_chars characters at an rcParams font size."""
+    size = matplotlib.font_manager.FontProperties(size=plt.rcParams[size_param]).get_size_in_points()
+    return n_chars * 0.6 * size / 72
+
+
+@lru_cache(maxsize=128)
+def _fixed_layout(
+    figsize: Tuple[float, float],
+    n_rows: int,
+    n_cols: int,
+    left: float,
+    right: float,
+    top: float,
+    bottom: float,
+    wgap: float = 0.0,
+    hgap: float = 0.0
+) -> Dict[str, float]:
+    """
+    Convert margins and gaps given in inches into subplots_adjust arguments.
+    
+    Args:
+        figsize: Figure size as (width, height) in inches
+        n_rows: Number of subplot rows
+        n_cols: Number of subplot columns
+        left, right, top, bottom: Outer margins in inches
+        wgap, hgap: Space between neighbouring axes in inches
+        
+    Returns:
+        Keyword arguments for Figure.subplots_adjust
+    """
+    width, height = figsize
+    # Keep at least a fifth of the figure for the axes themselves
+    scale_w = min(1.0, 0.8 * width / (left + right + wgap * (n_cols - 1)))
+    scale_h = min(1.0, 0.8 * height / (top + bottom + hgap * (n_rows - 1)))
+    left, right, wgap = left * scale_w, right * scale_w, wgap * scale_w
+    top, bottom, hgap = top * scale_h, bottom * scale_h, hgap * scale_h
+    
+    axes_width = (width - left - right - wgap * (n_cols - 1)) / n_cols
+    axes_height = (height - top - bottom - hgap * (n_rows - 1)) / n_rows
+    return {
+        'left': left / width,
+        'right': 1 - right / width,
+        'top': 1 - top / height,
+        'bottom': bottom / height,
+        'wspace': wgap / axes_width,
+        'hspace': hgap / axes_height,
+    }
+
+
+def _draw_histogram(ax: plt.Axes, counts: np.ndarray, edges: np.ndarray) -> None:
+    """
+    Draw pre-binned histogram counts as a single PolyCollection.
+    
+    Args:
+        ax: Matplotlib Axes object to draw on
+        counts: Count per bin
+        edges: Bin edges (one more than counts)
+    """
+    verts = _histogram_verts(counts, edges)
+    ax.add_collection(PolyCollection(verts, facecolors='C0', edgecolors='black', alpha=0.7))
+    ax.set_xlim(edges[0], edges[-1])
+    ax.set_ylim(0, max(counts.max(), 1) * 1.05)
+
+
+def _histogram_verts(counts: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Return one (left, 0) -> (left, h) -> (right, h) -> (right, 0) quad per bar."""
+    left, right = edges[:-1], edges[1:]
+    zeros = np.zeros_like(counts)
+    return np.stack([
+        np.column_stack([left, zeros]),
+        np.column_stack([left, counts]),
+        np.column_stack([right, counts]),
+        np.column_stack([right, zeros]),
+    ], axis=1)
+
+
+def _pairplot(
+    data: pd.DataFrame,
+    hue: Optional[str] = None,
+    reuse_figure: bool = False,
+    bins: int = 20
+) -> plt.Figure:
+    """
+    Draw a scatter-matrix of the numeric columns with batched artists.
+    
+    Every off-diagonal axes gets a single scatter PathCollection colored per
+    point (hue levels are treated as categories; create_plot sends numeric
+    hue columns to seaborn instead), and every diagonal axes a single PolyCollection holding the
+    histogram bars of all hue levels, so the artist count does not grow
+    with the number of hue levels.
+    
+    Args:
+        data: DataFrame containing the data
+        hue: Column name for color grouping
+        reuse_figure: Draw on a recycled off-screen figure from the figure pool
+        bins: Number of histogram bins on the diagonal
+        
+    Returns:
+        Matplotlib Figure object
+    """
+    variables = [col for col in data.select_dtypes(include=[np.number]).columns if col != hue]
+    if not variables:
+        raise ValueError("No numeric columns found in the data")
+    
+    # Colors are computed once for the whole figure from the hue codes;
+    # rows with a missing hue are not drawn, as in seaborn
+    if hue is not None:
+        hue_values = pd.Categorical(data[hue])
+        codes = hue_values.codes.astype(np.intp)
+        levels = hue_values.categories
+        cycle = matplotlib.colors.to_rgba_array(plt.rcParams['axes.prop_cycle'].by_key()['color'])
+        if len(levels) <= len(cycle):
+            palette = cycle[:len(levels)]
+        else:
+            palette = matplotlib.colormaps['turbo'](np.linspace(0, 1, len(levels)))
+        keep = codes >= 0
+        codes = codes[keep]
+        point_colors = palette[codes]
+    else:
+        levels = [None]
+        keep = slice(None)
+        codes = None
+        palette = matplotlib.colors.to_rgba_array(['C0'])
+        point_colors = palette
+    
+    values = data[variables].to_numpy(dtype=np.float64)[keep]
+    
+    k = len(variables)
+    fig = _new_figure((2.5 * k, 2.5 * k), reuse_figure)
+    axes = fig.subplots(k, k, squeeze=False)
+    
+    limits = []
+    for j in range(k):
+        finite = values[:, j][np.isfinite(values[:, j])]
+        if not finite.size:
+            # Nothing to draw for an all-NaN column; keep an empty (0, 1) axis
+            limits.append((0.0, 1.0))
+            continue
+        lo, hi = finite.min(), finite.max()
+        pad = (hi - lo) * 0.05 or 0.5
+        limits.append((lo - pad, hi + pad))
+    
+    for i in range(k):
+        for j in range(k):
+            ax = axes[i, j]
+            if i == j:
+                column = values[:, j]
+                finite = ~np.isnan(column)
+                column = column[finite]
+                edges = np.histogram_bin_edges(column, bins=bins)
+                # Per-level counts in one pass: bincount over (level, bin) pairs
+                bin_idx = np.clip(np.searchsorted(edges, column, side='right') - 1, 0, bins - 1)
+                level_idx = codes[finite] if codes is not None else 0
+                counts = np.bincount(
+                    level_idx * bins + bin_idx, minlength=len(levels) * bins
+                ).reshape(len(levels), bins)
+                verts = np.concatenate([_histogram_verts(c, edges) for c in counts])
+                ax.add_collection(PolyCollection(
+                    verts, facecolors=np.repeat(palette, bins, axis=0),
+                    edgecolors='white', linewidths=0.5, alpha=0.5
+                ))
+                ax.set_ylim(0, max(counts.max(), 1) * 1.05)
+                ax.set_yticks([])
+            else:
+                ax.scatter(values[:, j], values[:, i], c=point_colors, s=10, linewidths=0)
+                ax.set_ylim(limits[i])
+            ax.set_xlim(limits[j])
+            
+            if i < k - 1:
+                ax.tick_params(labelbottom=False)
+            else:
+                ax.set_xlabel(variables[j])
+            if j > 0 and i != j:
+                ax.tick_params(labelleft=False)
+            if j == 0:
+                ax.set_ylabel(variables[i])
+    
+    if hue is not None:
+        handles = [
+            matplotlib.lines.Line2D([], [], marker='o', linestyle='', color=color)
+            for color in palette
+        ]
+        fig.legend(handles, [str(level) for level in levels], title=hue,
+                   loc='center right', frameon=False)
+        fig.tight_layout(rect=(0, 0, 0.9, 1))
+    else:
+        fig.tight_layout()
+    return fig
+
+
+def _column_distribution(series: pd.Series, bins: int = 30) -> Tuple[str, Any]:
+    """
+    Compute the data behind one distribution subplot.
+    
+    Args:
+        series: Column to summarize
+        bins: Number of histogram bins for numeric columns
+        
+    Returns:
+        ("categorical", value_counts), ("numeric", (counts, edges)) or, for
+        dates, ("raw", values) to be binned by ax.hist, which knows
+        matplotlib's date units
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Count the integer codes directly; a stable sort on descending counts
+        # gives the same order as value_counts
+        codes = series.cat.codes.to_numpy()
+        categories = series.cat.categories
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        order = np.argsort(-counts, kind='stable')
+        return 'categorical', pd.Series(counts[order], index=categories[order])
+    if series.dtype == 'object':
+        return 'categorical', series.value_counts()
+    
+    # Drop NaN at the NumPy level instead of building a new Series
+    values = series.to_numpy(copy=False)
+    if values.dtype.kind == 'f':
+        values = values[~np.isnan(values)]
+    elif values.dtype.kind == 'b':
+        values = values.astype(np.uint8)
+    elif values.dtype.kind in 'iu':
+        pass
+    elif values.dtype.kind == 'm':
+        # matplotlib has no timedelta units; plot durations in seconds
+        values = series.dropna().dt.total_seconds().to_numpy()
+    elif pd.api.types.is_numeric_dtype(series.dtype):
+        # Nullable and Arrow-backed numeric columns
+        values = series.dropna().to_numpy(dtype=np.float64)
+    else:
+        return 'raw', series.dropna()
+    return 'numeric', np.histogram(values, bins=bins)
+
+
 def create_distribution_plot(
     data: pd.DataFrame,
     columns: Optional[List[str]] = None,
-    figsize: Tuple[int, int] = (15, 10)
+    figsize: Tuple[int, int] = (15, 10),
+    n_jobs: int = 1,
+    reuse_figure: bool = False
 ) -> plt.Figure:
     """
     Create distribution plots for multiple columns.
@@ -212,6 +860,9 @@ def create_distribution_plot(
         data: DataFrame containing the data
         columns: List of columns to plot (uses all numeric if None)
         figsize: Figure size as (width, height)
+        n_jobs: Number of threads used to bin columns (-1 for all cores);
+            drawing itself always happens on the calling thread
+        reuse_figure: Draw on a recycled off-screen figure from the figure pool
         
     Returns:
         Matplotlib Figure object
@@ -225,38 +876,78 @@ def create_distribution_plot(
     n_cols = min(3, len(columns))
     n_rows = (len(columns) + n_cols - 1) // n_cols
     
-    fig, axes = plt.subplots(n_rows, n_cols, figsize=figsize)
-    if n_rows == 1:
-        axes = axes.reshape(1, -1)
-    if n_cols == 1:
-        axes = axes.reshape(-1, 1)
+    # Only allocate axes for the grid cells that are actually used
+    fig = _new_figure(figsize, reuse_figure)
+    grid = fig.add_gridspec(n_rows, n_cols)
+    axes = [fig.add_subplot(grid[i // n_cols, i % n_cols]) for i in range(len(columns))]
     
-    for i, col in enumerate(columns):
-        row = i // n_cols
-        col_idx = i % n_cols
-        
-        if col in data.columns:
-            if data[col].dtype in ['object', 'category']:
+    present = [col for col in columns if col in data.columns]
+    
+    # Plain numeric columns are cast once into a column-major float64 block
+    # with one NaN mask, so every histogram bins a contiguous column of it.
+    # float32 is not enough here: columns with a large offset and a narrow
+    # range (e.g. Unix timestamps) would collapse onto a few values.
+    block_cols = list(dict.fromkeys(
+        col for col in present
+        if isinstance(data.dtypes[col], np.dtype) and data.dtypes[col].kind in 'biuf'
+    ))
+    block_positions = {col: j for j, col in enumerate(block_cols)}
+    if block_cols:
+        block = np.asfortranarray(data[block_cols].to_numpy(dtype=np.float64))
+        finite = ~np.isnan(block)
+    
+    def summarize(col):
+        j = block_positions.get(col)
+        if j is None:
+            return _column_distribution(data[col])
+        return 'numeric', np.histogram(block[finite[:, j], j], bins=30)
+    
+    # Summarize every column first (in parallel if requested), then draw serially
+    if n_jobs == 1 or len(present) < 2:
+        summaries = [summarize(col) for col in present]
+    else:
+        max_workers = os.cpu_count() if n_jobs < 0 else n_jobs
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            summaries = list(executor.map(summarize, present))
+    summaries = dict(zip(present, summaries))
+    
+    for ax, col in zip(axes, columns):
+        if col in summaries:
+            kind, summary = summaries[col]
+            if kind == 'categorical':
                 # Categorical data - bar plot
-                value_counts = data[col].value_counts()
-                axes[row, col_idx].bar(range(len(value_counts)), value_counts.values)
-                axes[row, col_idx].set_xticks(range(len(value_counts)))
-                axes[row, col_idx].set_xticklabels(value_counts.index, rotation=45)
-                axes[row, col_idx].set_title(f"Distribution of {col}")
+                value_counts = summary
+                positions = np.arange(len(value_counts))
+                ax.bar(positions, value_counts.to_numpy())
+                ax.set_xticks(positions, labels=value_counts.index.astype(str), rotation=45)
+                ax.set_title(f"Distribution of {col}")
             else:
                 # Numeric data - histogram
-                axes[row, col_idx].hist(data[col].dropna(), bins=30, alpha=0.7, edgecolor='black')
-                axes[row, col_idx].set_title(f"Distribution of {col}")
-                axes[row, col_idx].set_xlabel(col)
-                axes[row, col_idx].set_ylabel("Frequency")
-    
-    # Hide empty subplots
-    for i in range(len(columns), n_rows * n_cols):
-        row = i // n_cols
-        col_idx = i % n_cols
-        axes[row, col_idx].set_visible(False)
-    
-    plt.tight_layout()
+                if kind == 'raw':
+                    ax.hist(summary, bins=30, alpha=0.7, edgecolor='black')
+                else:
+                    _draw_histogram(ax, *summary)
+                ax.set_title(f"Distribution of {col}")
+                ax.set_xlabel(col)
+                ax.set_ylabel("Frequency")
+    
+    # Uniform grid: margins follow from the grid shape and the longest
+    # rotated (45 degree) categorical tick label per row instead of a
+    # tight_layout pass
+    rotated_inches = [0.0] * n_rows
+    for i, col in enumerate(columns):
+        kind, summary = summaries.get(col, (None, None))
+        if kind == 'categorical' and len(summary):
+            n_chars = max(len(str(label)) for label in summary.index)
+            rotated_inches[i // n_cols] = max(
+                rotated_inches[i // n_cols],
+                0.71 * _text_width_inches(n_chars, 'xtick.labelsize')
+            )
+    fig.subplots_adjust(**_fixed_layout(
+        tuple(fig.get_size_inches()), n_rows, n_cols,
+        left=0.8, right=0.2, top=0.45, bottom=0.6 + rotated_inches[-1],
+        wgap=0.9, hgap=0.95 + max(rotated_inches[:-1], default=0.0)
+    ))
     return fig
 
 
@@ -280,14 +971,28 @@ def add_statistical_annotations(
     try:
         from scipy import stats
         
-        # Perform statistical test
+        # Perform statistical test from per-group moments (no per-group iteration)
         if test == "t-test":
-            groups = [group[y].dropna() for name, group in data.groupby(x)]
-            if len(groups) == 2:
-                stat, p_value = stats.ttest_ind(groups[0], groups[1])
+            codes, uniques = pd.factorize(data[x], sort=True)
+            values = data[y].to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = (codes >= 0) & ~np.isnan(values)
+            counts, means, m2 = _grouped_moments(codes[valid], values[valid], len(uniques))
+            
+            if len(uniques) == 2:
+                # Student's t-test with pooled variance, as stats.ttest_ind
+                dof = counts.sum() - 2
+                pooled_var = m2.sum() / dof
+                stat = (means[0] - means[1]) / np.sqrt(pooled_var * (1 / counts[0] + 1 / counts[1]))
+                p_value = 2 * stats.t.sf(abs(stat), dof)
                 test_name = "t-test"
             else:
-                stat, p_value = stats.f_oneway(*groups)
+                # One-way ANOVA, as stats.f_oneway
+                n_groups, n_total = len(uniques), counts.sum()
+                grand_mean = (counts * means).sum() / n_total
+                ss_between = (counts * (means - grand_mean) ** 2).sum()
+                ss_within = m2.sum()
+                stat = (ss_between / (n_groups - 1)) / (ss_within / (n_total - n_groups))
+                p_value = stats.f.sf(stat, n_groups - 1, n_total - n_groups)
                 test_name = "ANOVA"
         
         # Add annotation
@@ -304,3 +1009,63 @@ def add_statistical_annotations(
         logger.warning("scipy not available, skipping statistical annotations")
     except Exception as e:
         logger.warning(f"Could not add statistical annotations: {e}")
+
+
+@lru_cache(maxsize=None)
+def _grouped_moments_kernel():
+    """
+    Compile the single-pass grouped Welford kernel on first use.
+    
+    Returns:
+        Numba-jitted function (codes, values, n_groups) -> (counts, means, M2),
+        or None if numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    
+    @njit(cache=True)
+    def kernel(codes, values, n_groups):
+        counts = np.zeros(n_groups, dtype=np.int64)
+        means = np.zeros(n_groups)
+        m2 = np.zeros(n_groups)
+        for i in range(codes.size):
+            g = codes[i]
+            counts[g] += 1
+            delta = values[i] - means[g]
+            means[g] += delta / counts[g]
+            m2[g] += delta * (values[i] - means[g])
+        return counts, means, m2
+    
+    return kernel
+
+
+def _grouped_moments(
+    codes: np.ndarray,
+    values: np.ndarray,
+    n_groups: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-group count, mean and sum of squared deviations (M2).
+    
+    Uses a numba Welford pass when numba is available, otherwise two
+    vectorized np.bincount passes.
+    
+    Args:
+        codes: Group index of each value (0 <= code < n_groups)
+        values: Values without NaNs
+        n_groups: Number of groups
+        
+    Returns:
+        Tuple of (counts, means, m2) arrays of length n_groups
+    """
+    kernel = _grouped_moments_kernel()
+    if kernel is not None:
+        return kernel(codes, values, n_groups)
+    
+    counts = np.bincount(codes, minlength=n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = np.bincount(codes, weights=values, minlength=n_groups) / counts
+    m2 = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=n_groups)
+    return counts, means, m2